@@ -4,6 +4,9 @@ import re
 from typing import Optional, List, Tuple
 from .base import BaseParser, ParseResult, ParsedConnection
 
+# Windows reports listening sockets as LISTENING; Linux and macOS use LISTEN.
+_STATE_ALIASES = {"LISTENING": "LISTEN"}
+
 
 class NetstatParser(BaseParser):
     """Parser for netstat output in various formats."""
@@ -403,17 +406,6 @@ class NetstatParser(BaseParser):
     def _normalize_state(self, state: str) -> str:
         """Normalize connection state across platforms."""
         state_upper = state.upper()
-
-        # Normalize LISTENING to LISTEN
-        if state_upper in ("LISTENING", "LISTEN"):
-            return "LISTEN"
-
-        # Standard states
-        if state_upper in ("ESTABLISHED", "TIME_WAIT", "CLOSE_WAIT", "FIN_WAIT1", "FIN_WAIT2", "SYN_RECV"):
-            return state_upper
-
-        # Handle other variations
-        if state_upper == "CLOSED":
-            return "CLOSED"
-
-        return state_upper if state_upper else "UNKNOWN"
+        # Platform spellings map to one canonical name; every other state
+        # (ESTABLISHED, TIME_WAIT, CLOSED, ...) is already canonical.
+        return _STATE_ALIASES.get(state_upper, state_upper) or "UNKNOWN"
@@ -1,6 +1,7 @@
 """Parser for traceroute output in multiple formats."""
 
 import re
+from ipaddress import ip_address
 from typing import Optional
 from .base import (
     BaseParser,
@@ -9,6 +10,26 @@ from .base import (
 )
 
 
+# Patterns are compiled once at import rather than looked up per line.
+# Unanchored patterns that scan runs of digits or non-space characters
+# start only at the beginning of a run: a match found mid-run is always
+# also found from the run's start, so results are unchanged, but a long
+# run without a match is no longer rescanned from every position.
+_LINUX_HOP_LINE_RE = re.compile(r"\s*\d+\s+")
+_WINDOWS_HOP_LINE_RE = re.compile(r"\s*\d+\s+\d+\s+ms")
+_LINUX_DEST_RE = re.compile(r"traceroute to\s+\S+\s+\(([^)]+)\)")
+_HOP_RE = re.compile(r"\s*(\d+)\s+(.+)")
+_TIMEOUT_HOP_RE = re.compile(r"^\*\s+\*\s+\*")
+_LINUX_HOST_IP_RE = re.compile(r"(\S+)\s+\(([^)]+)\)\s+(.+)")
+_LINUX_RTT_RE = re.compile(r"(?<!\d)(\d+(?:\.\d*)?)\s*ms")
+_WINDOWS_DEST_RE = re.compile(r"Tracing route to\s+\S+\s+\[([^\]]+)\]")
+_WINDOWS_RTT_RE = re.compile(r"(?<!\d)(\d+)\s*ms")
+_WINDOWS_HOST_IP_RE = re.compile(r"(?<!\S)(\S+)\s+\[([^\]]+)\]")
+_WINDOWS_RTT_STRIP_RE = re.compile(r"(?<!\d)\d+\s*ms")
+_MTR_HOP_RE = re.compile(r"\s*(\d+)\.\|--\s+(\S+)\s+")
+_MTR_VALUES_RE = re.compile(r"(?<![\d.])([\d.]+)(?:%|\s)")
+
+
 class TracerouteParser(BaseParser):
     """Parser for traceroute results in Linux/macOS, Windows, and MTR formats."""
 
@@ -67,10 +88,10 @@ class TracerouteParser(BaseParser):
         lines = data_stripped.split("\n")
         for line in lines:
             # Linux/macOS hop line: " 1  router.local (192.168.1.1)  1.234 ms"
-            if re.match(r"\s*\d+\s+", line) and "ms" in line.lower():
+            if _LINUX_HOP_LINE_RE.match(line) and "ms" in line.lower():
                 return "linux"
             # Windows hop line: "  1     1 ms     1 ms     1 ms  router.local"
-            if re.match(r"\s*\d+\s+\d+\s+ms", line):
+            if _WINDOWS_HOP_LINE_RE.match(line):
                 return "windows"
 
         return None
@@ -83,7 +104,7 @@ class TracerouteParser(BaseParser):
         # Extract destination from header (currently unused)
         for line in lines[:3]:  # Check first few lines for header
             # Match "traceroute to google.com (142.250.80.46)"
-            dest_match = re.search(r"traceroute to\s+\S+\s+\(([^)]+)\)", line)
+            dest_match = _LINUX_DEST_RE.search(line)
             if dest_match:
                 break
 
@@ -96,7 +117,7 @@ class TracerouteParser(BaseParser):
             # Match hop line: " 1  router.local (192.168.1.1)  1.234 ms  1.123 ms  1.456 ms"
             # Or just IP: " 2  10.0.0.1 (10.0.0.1)  5.678 ms  5.432 ms  5.789 ms"
             # Or timeout: " 3  * * *"
-            hop_match = re.match(r"\s*(\d+)\s+(.+)", line)
+            hop_match = _HOP_RE.match(line)
             if not hop_match:
                 continue
 
@@ -109,7 +130,7 @@ class TracerouteParser(BaseParser):
                 continue
 
             # Check for timeout (all asterisks)
-            if re.match(r"^\*\s+\*\s+\*", hop_content.strip()):
+            if _TIMEOUT_HOP_RE.match(hop_content.strip()):
                 route_hop = ParsedRouteHop(hop_number=hop_number)
                 result.route_hops.append(route_hop)
                 continue
@@ -119,7 +140,7 @@ class TracerouteParser(BaseParser):
             ip_address = None
 
             # Try to match "hostname (ip)" pattern
-            host_ip_match = re.match(r"(\S+)\s+\(([^)]+)\)\s+(.+)", hop_content)
+            host_ip_match = _LINUX_HOST_IP_RE.match(hop_content)
             if host_ip_match:
                 hostname = host_ip_match.group(1)
                 ip_address = host_ip_match.group(2)
@@ -135,7 +156,7 @@ class TracerouteParser(BaseParser):
 
             # Parse RTT values (up to 3 samples)
             rtt_values = []
-            rtt_matches = re.findall(r"(\d+\.?\d*)\s*ms", rtt_str)
+            rtt_matches = _LINUX_RTT_RE.findall(rtt_str)
             for rtt_match in rtt_matches[:3]:  # Take up to 3 samples
                 try:
                     rtt_values.append(float(rtt_match))
@@ -161,7 +182,7 @@ class TracerouteParser(BaseParser):
         # Extract destination from header (currently unused)
         for line in lines[:3]:  # Check first few lines for header
             # Match "Tracing route to google.com [142.250.80.46]"
-            dest_match = re.search(r"Tracing route to\s+\S+\s+\[([^\]]+)\]", line)
+            dest_match = _WINDOWS_DEST_RE.search(line)
             if dest_match:
                 break
 
@@ -182,7 +203,7 @@ class TracerouteParser(BaseParser):
             # Windows format: "  1     1 ms     1 ms     1 ms  router.local [192.168.1.1]"
             # Or with Request timed out: "  3     *        *        *     Request timed out."
             # Match hop number at start
-            hop_match = re.match(r"\s*(\d+)\s+(.+)", line)
+            hop_match = _HOP_RE.match(line)
             if not hop_match:
                 continue
 
@@ -206,7 +227,7 @@ class TracerouteParser(BaseParser):
 
             # Extract RTT values (they come before the hostname)
             rtt_values = []
-            rtt_matches = re.findall(r"(\d+)\s*ms", hop_content)
+            rtt_matches = _WINDOWS_RTT_RE.findall(hop_content)
             for rtt_match in rtt_matches[:3]:  # Take up to 3 samples
                 try:
                     rtt_values.append(float(rtt_match))
@@ -218,14 +239,14 @@ class TracerouteParser(BaseParser):
             hostname = None
             ip_address = None
 
-            host_ip_match = re.search(r"(\S+)\s+\[([^\]]+)\]", hop_content)
+            host_ip_match = _WINDOWS_HOST_IP_RE.search(hop_content)
             if host_ip_match:
                 hostname = host_ip_match.group(1)
                 ip_address = host_ip_match.group(2)
             else:
                 # Just an IP without brackets
                 # Remove RTT values from the line and get the last token
-                remaining = re.sub(r"\d+\s*ms", "", hop_content).strip()
+                remaining = _WINDOWS_RTT_STRIP_RE.sub("", hop_content).strip()
                 if remaining:
                     ip_address = remaining.split()[-1]
 
@@ -254,7 +275,7 @@ class TracerouteParser(BaseParser):
 
             # MTR format: "  1.|-- router.local              0.0%    10    1.2   1.3   1.1   1.5   0.1"
             # Match hop line starting with number and pipe
-            hop_match = re.match(r"\s*(\d+)\.\|--\s+(\S+)\s+", line_stripped)
+            hop_match = _MTR_HOP_RE.match(line_stripped)
             if not hop_match:
                 continue
 
@@ -282,7 +303,7 @@ class TracerouteParser(BaseParser):
 
             # Extract all numeric values after hostname
             remaining = line_stripped[hop_match.end() :]
-            values = re.findall(r"([\d.]+)(?:%|\s)", remaining)
+            values = _MTR_VALUES_RE.findall(remaining)
 
             # Skip first value (loss percentage) and get the numeric RTT values
             # Usually: Loss%, Snt, Last, Avg, Best, Wrst, StDev
@@ -316,21 +337,9 @@ class TracerouteParser(BaseParser):
 
     @staticmethod
     def _is_ip_address(value: str) -> bool:
-        """Check if a string is an IP address."""
-        # Simple check for IPv4
-        parts = value.split(".")
-        if len(parts) == 4:
-            try:
-                for part in parts:
-                    num = int(part)
-                    if num < 0 or num > 255:
-                        return False
-                return True
-            except ValueError:
-                pass
-
-        # Simple check for IPv6 (contains colons)
-        if ":" in value:
-            return True
-
-        return False
+        """Check if a string is an IPv4 or IPv6 address."""
+        try:
+            ip_address(value)
+        except ValueError:
+            return False
+        return True
@@ -6,12 +6,13 @@ from sqlalchemy import select, func
 from database import get_db
 from auth.dependencies import require_any_authenticated
 from models import ARPEntry, User
-from schemas import ARPEntryResponse, PaginatedResponse
+from schemas import ARPEntryResponse
+from routers.pagination import PAGINATED_RESPONSES, paginated_json
 
 router = APIRouter(prefix="/api/arp", tags=["arp"])
 
 
-@router.get("", response_model=PaginatedResponse)
+@router.get("", responses=PAGINATED_RESPONSES)
 async def list_arp_entries(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=1000),
@@ -42,9 +43,4 @@ async def list_arp_entries(
     )
     entries = result.scalars().all()
 
-    return {
-        "total": total,
-        "skip": skip,
-        "limit": limit,
-        "items": [ARPEntryResponse.model_validate(entry) for entry in entries],
-    }
+    return paginated_json(total, skip, limit, ARPEntryResponse, entries)
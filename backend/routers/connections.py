@@ -6,12 +6,13 @@ from sqlalchemy import select, func
 from database import get_db
 from auth.dependencies import require_any_authenticated
 from models import Connection, User
-from schemas import ConnectionResponse, PaginatedResponse
+from schemas import ConnectionResponse
+from routers.pagination import PAGINATED_RESPONSES, paginated_json
 
 router = APIRouter(prefix="/api/connections", tags=["connections"])
 
 
-@router.get("", response_model=PaginatedResponse)
+@router.get("", responses=PAGINATED_RESPONSES)
 async def list_connections(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=1000),
@@ -46,9 +47,4 @@ async def list_connections(
     )
     connections = result.scalars().all()
 
-    return {
-        "total": total,
-        "skip": skip,
-        "limit": limit,
-        "items": [ConnectionResponse.model_validate(conn) for conn in connections],
-    }
+    return paginated_json(total, skip, limit, ConnectionResponse, connections)
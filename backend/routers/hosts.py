@@ -11,14 +11,14 @@ from schemas import (
     HostUpdate,
     HostResponse,
     PortResponse,
-    PaginatedResponse,
 )
+from routers.pagination import PAGINATED_RESPONSES, paginated_json
 from utils.audit import audit
 
 router = APIRouter(prefix="/api/hosts", tags=["hosts"])
 
 
-@router.get("", response_model=PaginatedResponse)
+@router.get("", responses=PAGINATED_RESPONSES)
 async def list_hosts(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=1000),
@@ -62,12 +62,7 @@ async def list_hosts(
         for host in hosts:
             setattr(host, "ports_count", ports_count_map.get(host.id, 0))
 
-    return {
-        "total": total,
-        "skip": skip,
-        "limit": limit,
-        "items": [HostResponse.model_validate(host) for host in hosts],
-    }
+    return paginated_json(total, skip, limit, HostResponse, hosts)
 
 
 @router.get("/{host_id}", response_model=dict)
@@ -12,7 +12,8 @@ from pathlib import Path
 from database import get_db, AsyncSessionLocal
 from models import RawImport, Host, Port, Connection, ARPEntry, User
 from auth.dependencies import require_any_authenticated, require_editor
-from schemas import RawImportResponse, PaginatedResponse
+from schemas import RawImportResponse
+from routers.pagination import PAGINATED_RESPONSES, paginated_json
 from parsers import get_parser, PARSERS
 from config import settings
 from services.file_validator import MAX_FILE_SIZE_BYTES, validate_upload
@@ -627,7 +628,7 @@ async def import_file(
     }
 
 
-@router.get("", response_model=PaginatedResponse)
+@router.get("", responses=PAGINATED_RESPONSES)
 async def list_imports(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=1000),
@@ -665,12 +666,7 @@ async def list_imports(
     )
     imports = result.scalars().all()
 
-    return {
-        "total": total,
-        "skip": skip,
-        "limit": limit,
-        "items": [RawImportResponse.model_validate(imp) for imp in imports],
-    }
+    return paginated_json(total, skip, limit, RawImportResponse, imports)
 
 
 @router.get("/parsers", response_model=dict)
@@ -0,0 +1,43 @@
+"""Shared JSON rendering for paginated list endpoints."""
+
+from collections.abc import Sequence
+from functools import cache
+from typing import Any
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from schemas import PaginatedResponse
+
+# Routes returning paginated_json() document the page shape here rather than
+# with response_model: FastAPI never checks a returned Response against
+# response_model, so declaring one would promise validation that never runs.
+PAGINATED_RESPONSES = {200: {"model": PaginatedResponse}}
+
+
+@cache
+def _list_adapter(item_schema: type[BaseModel]) -> TypeAdapter:
+    # Built once per response schema, so a whole page validates in one
+    # pydantic-core call rather than one model_validate() per row.
+    return TypeAdapter(list[item_schema])
+
+
+def paginated_json(
+    total: int,
+    skip: int,
+    limit: int,
+    item_schema: type[BaseModel],
+    rows: Sequence[Any],
+) -> Response:
+    """Render one page of ORM rows as a PaginatedResponse JSON body.
+
+    The rows are validated into ``item_schema``, then the page is serialized
+    in one pydantic-core pass instead of letting FastAPI re-validate it and
+    run jsonable_encoder over every item.
+    """
+    page = PaginatedResponse(
+        total=total,
+        skip=skip,
+        limit=limit,
+        items=_list_adapter(item_schema).validate_python(rows, from_attributes=True),
+    )
+    return Response(content=page.model_dump_json(), media_type="application/json")
@@ -7,7 +7,8 @@ Architecture:
   - *Create / *Update classes: inherit from *Fields and ADD strict validators
     so bad data is rejected early with clear, actionable error messages.
   - *Response classes: inherit from *Fields directly (no validators) so any
-    data already in the database serializes without crashing.
+    data already in the database serializes without crashing.  The entity
+    responses are frozen: they are built once from ORM rows and only read.
 
 This separation is critical because parsers write directly to DB models and
 may produce values that were never validated through the API schemas (e.g.
@@ -15,12 +16,17 @@ nmap returns device_type="wireless_ap", netstat returns state="LISTEN").
 """
 
 from datetime import datetime
-from typing import Any, Dict, Optional, List
+from functools import lru_cache
+from typing import Annotated, Any, Dict, Optional, List, Tuple
 from ipaddress import ip_address as parse_ip
+from socket import AF_INET, inet_pton
 import re
+import sys
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from utils.ip_memo import call_ip_parser
+
 
 # ── Allowed value sets (for input validation) ────────────────────────
 #
@@ -88,13 +94,96 @@ VALID_AGENT_CHECKIN_STATUSES = frozenset({
     "rejected",
 })
 
+# Value sets checked through _validate_choice().
+_CHOICE_SETS = (
+    VALID_DEVICE_TYPES, VALID_OS_FAMILIES, VALID_CRITICALITIES,
+    VALID_PROTOCOLS, VALID_PORT_STATES, VALID_CONNECTION_STATES,
+    VALID_SOURCE_TYPES, VALID_IMPORT_TYPES,
+    VALID_AGENT_ENROLLMENT_STATES,
+)
+
+# One canonical, interned string per allowed value.  _validate_choice()
+# returns these instead of the fresh str that .lower() allocates, so every
+# validated "router" or "tcp" is the same object.
+_CANONICAL_CHOICES = {
+    value: sys.intern(value)
+    for allowed in _CHOICE_SETS
+    for value in allowed
+}
+
+# The "Allowed values: ..." tail of each rejection message, sorted once at
+# import rather than on every invalid value.
+_ALLOWED_VALUES_TEXT = {
+    allowed: ", ".join(sorted(allowed)) for allowed in _CHOICE_SETS
+}
+
 # ── Reusable validators ──────────────────────────────────────────────
 
-MAC_RE = re.compile(r"^([0-9A-Fa-f]{2}[:\-]){5}[0-9A-Fa-f]{2}$")
-HOSTNAME_RE = re.compile(r"^[a-zA-Z0-9._\-]+$")
+HOSTNAME_RE = re.compile(r"^[a-zA-Z0-9._\-]+\Z")
 
 RAW_DATA_MAX_BYTES = 10 * 1024 * 1024  # 10 MB
 
+# TCP/UDP port range, enforced inside pydantic-core rather than a Python
+# validator.  Shared by every schema that carries a port.
+PortNumber = Annotated[int, Field(ge=0, le=65535)]
+
+# OS detection confidence percentage, shared by HostCreate and HostUpdate.
+OsConfidence = Annotated[int, Field(ge=0, le=100)]
+
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_MAC_SEPARATORS = frozenset(":-")
+
+
+def _is_mac(value: str) -> bool:
+    """Return True for XX:XX:XX:XX:XX:XX or XX-XX-XX-XX-XX-XX strings.
+
+    MAC addresses have a fixed 17-character shape, so a positional
+    character-class check is cheaper than running the regex engine.
+    The stride-3 slices pick out the first hex digit of each octet, the
+    second hex digit, and the five separators; issuperset() then walks
+    each slice in C instead of a per-character Python loop.
+    """
+    return (
+        len(value) == 17
+        and _MAC_SEPARATORS.issuperset(value[2::3])
+        and _HEX_DIGITS.issuperset(value[0::3])
+        and _HEX_DIGITS.issuperset(value[1::3])
+    )
+
+
+_UNSPECIFIED_IPV4 = bytes(4)
+
+
+def _ip_info(value: str) -> Optional[Tuple[int, bool]]:
+    """Classify an IP address string as ``(version, is_unspecified)``.
+
+    Returns None instead of raising, so a rejected address raises exactly
+    one ValueError (the user-facing one) with no chained parser exception.
+    call_ip_parser() keeps over-long values out of the parser's cache.
+    """
+    return call_ip_parser(_parse_ip_info, value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_ip_info(value: str) -> Optional[Tuple[int, bool]]:
+    """Parse an IP string for _ip_info().
+
+    Every IPv6 literal contains ':' and no IPv4 literal does, so each value
+    goes to exactly one parser: ipaddress for IPv6 (including scope IDs),
+    socket.inet_pton() -- a single C call -- for IPv4.  Scan data repeats
+    the same addresses heavily, so the outcome is memoized.
+    """
+    if ":" in value:
+        try:
+            addr = parse_ip(value)
+        except ValueError:
+            return None
+        return 6, addr.is_unspecified
+    try:
+        return 4, inet_pton(AF_INET, value) == _UNSPECIFIED_IPV4
+    except (OSError, ValueError):
+        return None
+
 
 def _validate_ip(
     value: str,
@@ -102,23 +191,40 @@ def _validate_ip(
     allow_unspecified: bool = False,
 ) -> str:
     """Validate an IPv4 or IPv6 address string."""
-    try:
-        addr = parse_ip(value)
-    except ValueError:
+    info = _ip_info(value)
+    if info is None:
         raise ValueError(
             f"Invalid {field_name} '{value}'. "
             "Expected IPv4 (e.g. 192.168.1.1) or IPv6 (e.g. 2001:db8::1)"
         )
-    if addr.is_unspecified and not allow_unspecified:
+    if info[1] and not allow_unspecified:
         raise ValueError(
             f"Unspecified {field_name} ({value}) is not allowed"
         )
     return value
 
 
+def _validate_ipv6(value: str) -> str:
+    """Validate an IPv6-only address string."""
+    info = _ip_info(value)
+    if info is None:
+        raise ValueError(
+            f"Invalid IPv6 address '{value}'. "
+            "Expected format like 2001:db8::1"
+        )
+    version, unspecified = info
+    if version != 6:
+        raise ValueError(
+            f"Expected IPv6 address, got IPv4 '{value}'"
+        )
+    if unspecified:
+        raise ValueError("Unspecified IPv6 address (::) is not allowed")
+    return value
+
+
 def _validate_mac(value: str) -> str:
     """Validate a MAC address string."""
-    if not MAC_RE.match(value):
+    if not _is_mac(value):
         raise ValueError(
             f"Invalid MAC address '{value}'. "
             "Expected format XX:XX:XX:XX:XX:XX or XX-XX-XX-XX-XX-XX "
@@ -127,20 +233,51 @@ def _validate_mac(value: str) -> str:
     return value
 
 
-def _validate_hostname(value: str) -> str:
-    """Validate a hostname string."""
+@lru_cache(maxsize=8192)
+def _is_hostname(value: str) -> bool:
+    """Return True if the value matches HOSTNAME_RE.
+
+    Scan data repeats the same host names heavily, so the outcome is
+    memoized.  Callers check the 255-character limit first, which keeps
+    the cache footprint bounded.
+    """
+    return HOSTNAME_RE.match(value) is not None
+
+
+def _validate_dns_name(value: str, kind: str) -> str:
+    """Validate a hostname or FQDN string.
+
+    Both fields share one length limit and one character pattern; *kind*
+    ("hostname" or "FQDN") only changes the wording of the error.
+    """
     if len(value) > 255:
         raise ValueError(
-            "Hostname too long. Maximum 255 characters allowed"
+            f"{kind[0].upper()}{kind[1:]} too long. "
+            "Maximum 255 characters allowed"
         )
-    if not HOSTNAME_RE.match(value):
+    if not _is_hostname(value):
         raise ValueError(
-            f"Invalid hostname '{value}'. "
+            f"Invalid {kind} '{value}'. "
             "Use only alphanumeric characters, hyphens, dots, and underscores"
         )
     return value
 
 
+def _validate_choice(value: str, allowed: frozenset, label: str) -> str:
+    """Lower-case a value and check it against an allowed value set."""
+    # Parser output and most API input are already lower-case, so try the
+    # value as given before paying for the lower() copy.
+    if value in allowed:
+        return _CANONICAL_CHOICES[value]
+    lower = value.lower()
+    if lower not in allowed:
+        raise ValueError(
+            f"Invalid {label} '{value}'. "
+            f"Allowed values: {_ALLOWED_VALUES_TEXT[allowed]}"
+        )
+    return _CANONICAL_CHOICES[lower]
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # HOST SCHEMAS
 # ═══════════════════════════════════════════════════════════════════════
@@ -157,7 +294,7 @@ class HostFields(BaseModel):
     os_name: Optional[str] = None
     os_version: Optional[str] = None
     os_family: Optional[str] = None
-    os_confidence: Optional[int] = Field(None, ge=0, le=100)
+    os_confidence: Optional[OsConfidence] = None
     device_type: Optional[str] = None
     vendor: Optional[str] = None
     criticality: Optional[str] = None
@@ -185,20 +322,7 @@ class _HostValidators:
     def validate_ipv6(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        try:
-            addr = parse_ip(v)
-        except ValueError:
-            raise ValueError(
-                f"Invalid IPv6 address '{v}'. "
-                "Expected format like 2001:db8::1"
-            )
-        if addr.version != 6:
-            raise ValueError(
-                f"Expected IPv6 address, got IPv4 '{v}'"
-            )
-        if addr.is_unspecified:
-            raise ValueError("Unspecified IPv6 address (::) is not allowed")
-        return v
+        return _validate_ipv6(v)
 
     @field_validator("mac_address")
     @classmethod
@@ -212,60 +336,35 @@ class _HostValidators:
     def validate_hostname(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        return _validate_hostname(v)
+        return _validate_dns_name(v, "hostname")
 
     @field_validator("fqdn")
     @classmethod
     def validate_fqdn(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        if len(v) > 255:
-            raise ValueError("FQDN too long. Maximum 255 characters allowed")
-        if not HOSTNAME_RE.match(v):
-            raise ValueError(
-                f"Invalid FQDN '{v}'. "
-                "Use only alphanumeric characters, hyphens, dots, and underscores"
-            )
-        return v
+        return _validate_dns_name(v, "FQDN")
 
     @field_validator("os_family")
     @classmethod
     def validate_os_family(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        lower = v.lower()
-        if lower not in VALID_OS_FAMILIES:
-            raise ValueError(
-                f"Invalid OS family '{v}'. "
-                f"Allowed values: {', '.join(sorted(VALID_OS_FAMILIES))}"
-            )
-        return lower
+        return _validate_choice(v, VALID_OS_FAMILIES, "OS family")
 
     @field_validator("device_type")
     @classmethod
     def validate_device_type(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        lower = v.lower()
-        if lower not in VALID_DEVICE_TYPES:
-            raise ValueError(
-                f"Invalid device type '{v}'. "
-                f"Allowed values: {', '.join(sorted(VALID_DEVICE_TYPES))}"
-            )
-        return lower
+        return _validate_choice(v, VALID_DEVICE_TYPES, "device type")
 
     @field_validator("criticality")
     @classmethod
     def validate_criticality(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        lower = v.lower()
-        if lower not in VALID_CRITICALITIES:
-            raise ValueError(
-                f"Invalid criticality '{v}'. "
-                f"Allowed values: {', '.join(sorted(VALID_CRITICALITIES))}"
-            )
-        return lower
+        return _validate_choice(v, VALID_CRITICALITIES, "criticality")
 
 
 class HostCreate(HostFields, _HostValidators):
@@ -285,7 +384,7 @@ class HostUpdate(BaseModel, _HostValidators):
     os_name: Optional[str] = None
     os_version: Optional[str] = None
     os_family: Optional[str] = None
-    os_confidence: Optional[int] = Field(None, ge=0, le=100)
+    os_confidence: Optional[OsConfidence] = None
     device_type: Optional[str] = None
     vendor: Optional[str] = None
     criticality: Optional[str] = None
@@ -308,7 +407,7 @@ class HostResponse(HostFields):
     first_seen: datetime
     last_seen: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ── Backwards compatibility alias ────────────────────────────────────
@@ -322,7 +421,7 @@ HostBase = HostFields
 class PortFields(BaseModel):
     """Pure field definitions for ports.  No validators."""
 
-    port_number: int = Field(..., ge=0, le=65535)
+    port_number: PortNumber
     protocol: str
     state: str
     service_name: Optional[str] = Field(None, max_length=255)
@@ -342,29 +441,17 @@ class _PortValidators:
 
     @field_validator("protocol")
     @classmethod
-    def validate_protocol(cls, v):
+    def validate_protocol(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        lower = v.lower()
-        if lower not in VALID_PROTOCOLS:
-            raise ValueError(
-                f"Invalid protocol '{v}'. "
-                f"Allowed values: {', '.join(sorted(VALID_PROTOCOLS))}"
-            )
-        return lower
+        return _validate_choice(v, VALID_PROTOCOLS, "protocol")
 
     @field_validator("state")
     @classmethod
-    def validate_state(cls, v):
+    def validate_state(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        lower = v.lower()
-        if lower not in VALID_PORT_STATES:
-            raise ValueError(
-                f"Invalid port state '{v}'. "
-                f"Allowed values: {', '.join(sorted(VALID_PORT_STATES))}"
-            )
-        return lower
+        return _validate_choice(v, VALID_PORT_STATES, "port state")
 
 
 class PortCreate(PortFields, _PortValidators):
@@ -375,7 +462,7 @@ class PortCreate(PortFields, _PortValidators):
 class PortUpdate(BaseModel, _PortValidators):
     """Schema for updating a port (all fields optional, with validation)."""
 
-    port_number: Optional[int] = Field(None, ge=0, le=65535)
+    port_number: Optional[PortNumber] = None
     protocol: Optional[str] = None
     state: Optional[str] = None
     service_name: Optional[str] = Field(None, max_length=255)
@@ -398,7 +485,7 @@ class PortResponse(PortFields):
     first_seen: datetime
     last_seen: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ── Backwards compatibility alias ────────────────────────────────────
@@ -413,9 +500,9 @@ class ConnectionFields(BaseModel):
     """Pure field definitions for connections.  No validators."""
 
     local_ip: str
-    local_port: int = Field(..., ge=0, le=65535)
+    local_port: PortNumber
     remote_ip: str
-    remote_port: Optional[int] = Field(None, ge=0, le=65535)
+    remote_port: Optional[PortNumber] = None
     protocol: str
     state: Optional[str] = None
     pid: Optional[int] = None
@@ -449,26 +536,14 @@ class _ConnectionValidators:
     def validate_protocol(cls, v):
         if v is None:
             return v
-        lower = v.lower()
-        if lower not in VALID_PROTOCOLS:
-            raise ValueError(
-                f"Invalid protocol '{v}'. "
-                f"Allowed values: {', '.join(sorted(VALID_PROTOCOLS))}"
-            )
-        return lower
+        return _validate_choice(v, VALID_PROTOCOLS, "protocol")
 
     @field_validator("state")
     @classmethod
     def validate_state(cls, v):
         if v is None:
             return v
-        lower = v.lower()
-        if lower not in VALID_CONNECTION_STATES:
-            raise ValueError(
-                f"Invalid connection state '{v}'. "
-                f"Allowed values: {', '.join(sorted(VALID_CONNECTION_STATES))}"
-            )
-        return lower
+        return _validate_choice(v, VALID_CONNECTION_STATES, "connection state")
 
 
 class ConnectionCreate(ConnectionFields, _ConnectionValidators):
@@ -483,7 +558,7 @@ class ConnectionResponse(ConnectionFields):
     first_seen: datetime
     last_seen: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ── Backwards compatibility alias ────────────────────────────────────
@@ -538,7 +613,7 @@ class ARPEntryResponse(ARPEntryFields):
     first_seen: datetime
     last_seen: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ── Backwards compatibility alias ────────────────────────────────────
@@ -569,39 +644,35 @@ class _RawImportValidators:
     def validate_source_type(cls, v):
         if v is None:
             return v
-        lower = v.lower()
-        if lower not in VALID_SOURCE_TYPES:
-            raise ValueError(
-                f"Invalid source type '{v}'. "
-                f"Allowed values: {', '.join(sorted(VALID_SOURCE_TYPES))}"
-            )
-        return lower
+        return _validate_choice(v, VALID_SOURCE_TYPES, "source type")
 
     @field_validator("import_type")
     @classmethod
     def validate_import_type(cls, v):
         if v is None:
             return v
-        lower = v.lower()
-        if lower not in VALID_IMPORT_TYPES:
-            raise ValueError(
-                f"Invalid import type '{v}'. "
-                f"Allowed values: {', '.join(sorted(VALID_IMPORT_TYPES))}"
-            )
-        return lower
+        return _validate_choice(v, VALID_IMPORT_TYPES, "import type")
 
     @field_validator("raw_data")
     @classmethod
     def validate_raw_data(cls, v):
         if v is None:
             return v
-        if not v or not v.strip():
-            raise ValueError("Raw data cannot be empty")
-        if len(v.encode("utf-8", errors="replace")) > RAW_DATA_MAX_BYTES:
+        # Size first: every character is at least one UTF-8 byte, so an
+        # over-long string is rejected in O(1) before anything scans it.
+        # str.isascii() is also O(1) in CPython, and ASCII text is one byte
+        # per character, so the UTF-8 copy is only needed for non-ASCII input.
+        if len(v) > RAW_DATA_MAX_BYTES or (
+            not v.isascii()
+            and len(v.encode("utf-8", errors="replace")) > RAW_DATA_MAX_BYTES
+        ):
             raise ValueError(
                 f"Raw data too large. "
                 f"Maximum {RAW_DATA_MAX_BYTES // (1024 * 1024)} MB allowed"
             )
+        # isspace() scans without building a stripped copy of the payload.
+        if not v or v.isspace():
+            raise ValueError("Raw data cannot be empty")
         return v
 
     @field_validator("source_host")
@@ -609,19 +680,20 @@ class _RawImportValidators:
     def validate_source_host(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        # Source host can be an IP or a hostname
-        try:
-            parse_ip(v)
-            return v
-        except ValueError:
-            pass
-        # Allow hostname format
-        if not HOSTNAME_RE.match(v) or len(v) > 255:
-            raise ValueError(
-                f"Invalid source host '{v}'. "
-                "Expected a valid IP address or hostname"
-            )
-        return v
+        # Source host can be an IP or a hostname.  HOSTNAME_RE never admits
+        # ':' but does admit every dotted-quad IPv4 literal, so only values
+        # containing a colon need the IP parser.  The 255-character cap is
+        # checked first so oversized input never reaches either parser.
+        if len(v) <= 255:
+            if ":" in v:
+                if _ip_info(v) is not None:
+                    return v
+            elif _is_hostname(v):
+                return v
+        raise ValueError(
+            f"Invalid source host '{v}'. "
+            "Expected a valid IP address or hostname"
+        )
 
 
 class RawImportCreate(RawImportFields, _RawImportValidators):
@@ -639,7 +711,7 @@ class RawImportResponse(RawImportFields):
     created_at: datetime
     processed_at: Optional[datetime] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ── Backwards compatibility alias ────────────────────────────────────
@@ -670,41 +742,34 @@ class _DeviceIdentityValidators:
     def validate_device_type(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        lower = v.lower()
-        if lower not in VALID_DEVICE_TYPES:
-            raise ValueError(
-                f"Invalid device type '{v}'. "
-                f"Allowed values: {', '.join(sorted(VALID_DEVICE_TYPES))}"
-            )
-        return lower
+        return _validate_choice(v, VALID_DEVICE_TYPES, "device type")
 
     @field_validator("mac_addresses")
     @classmethod
     def validate_mac_list(cls, v: Optional[List[str]]) -> Optional[List[str]]:
-        if v is None:
+        # None and [] need no per-element checks.  all(map(...)) keeps the
+        # happy path out of the interpreter loop; the offender is located
+        # only when there is one.
+        if not v or all(map(_is_mac, v)):
             return v
-        for i, mac in enumerate(v):
-            if not MAC_RE.match(mac):
-                raise ValueError(
-                    f"Invalid MAC address at index {i}: '{mac}'. "
-                    "Expected format XX:XX:XX:XX:XX:XX"
-                )
-        return v
+        i, mac = next((i, mac) for i, mac in enumerate(v) if not _is_mac(mac))
+        raise ValueError(
+            f"Invalid MAC address at index {i}: '{mac}'. "
+            "Expected format XX:XX:XX:XX:XX:XX"
+        )
 
     @field_validator("ip_addresses")
     @classmethod
     def validate_ip_list(cls, v: Optional[List[str]]) -> Optional[List[str]]:
-        if v is None:
+        # None and [] need no per-element checks.  _ip_info() returns a
+        # truthy tuple for valid addresses and None otherwise.
+        if not v or all(map(_ip_info, v)):
             return v
-        for i, ip in enumerate(v):
-            try:
-                parse_ip(ip)
-            except ValueError:
-                raise ValueError(
-                    f"Invalid IP address at index {i}: '{ip}'. "
-                    "Expected valid IPv4 or IPv6 address"
-                )
-        return v
+        i, ip = next((i, ip) for i, ip in enumerate(v) if _ip_info(ip) is None)
+        raise ValueError(
+            f"Invalid IP address at index {i}: '{ip}'. "
+            "Expected valid IPv4 or IPv6 address"
+        )
 
 
 class DeviceIdentityCreate(DeviceIdentityFields, _DeviceIdentityValidators):
@@ -727,13 +792,17 @@ class DeviceIdentityUpdate(BaseModel, _DeviceIdentityValidators):
 class DeviceIdentityResponse(DeviceIdentityFields):
     """Schema for device identity responses — no validators."""
 
+    # Tuples rather than lists so the frozen response is read-only all the
+    # way down; they still serialize as JSON arrays.
+    mac_addresses: Optional[Tuple[str, ...]] = None
+    ip_addresses: Optional[Tuple[str, ...]] = None
     id: int
     guid: Optional[str] = None
     first_seen: datetime
     last_seen: datetime
     host_count: Optional[int] = None  # Number of linked hosts
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ── Backwards compatibility alias ────────────────────────────────────
@@ -777,7 +846,7 @@ class _AgentPolicyValidators:
     @field_validator("enabled_commands")
     @classmethod
     def validate_enabled_commands(cls, value: Dict[str, bool]) -> Dict[str, bool]:
-        unexpected = sorted(set(value.keys()) - VALID_AGENT_COMMANDS)
+        unexpected = sorted(value.keys() - VALID_AGENT_COMMANDS)
         if unexpected:
             raise ValueError(
                 f"Invalid agent commands: {', '.join(unexpected)}. "
@@ -884,13 +953,7 @@ class _AgentValidators:
     @field_validator("enrollment_state")
     @classmethod
     def validate_enrollment_state(cls, value: str) -> str:
-        lower = value.lower()
-        if lower not in VALID_AGENT_ENROLLMENT_STATES:
-            raise ValueError(
-                f"Invalid enrollment state '{value}'. "
-                f"Allowed values: {', '.join(sorted(VALID_AGENT_ENROLLMENT_STATES))}"
-            )
-        return lower
+        return _validate_choice(value, VALID_AGENT_ENROLLMENT_STATES, "enrollment state")
 
 
 class AgentCreate(AgentFields, _AgentValidators):
@@ -957,52 +1020,18 @@ class AgentNeighborObservation(BaseModel):
         return _validate_mac(value)
 
 
-class AgentConnectionObservation(BaseModel):
-    """Single passive connection observation."""
+class AgentConnectionObservation(BaseModel, _ConnectionValidators):
+    """Single passive connection observation (validated like ConnectionCreate)."""
 
     local_ip: str
-    local_port: int = Field(..., ge=0, le=65535)
+    local_port: PortNumber
     remote_ip: str
-    remote_port: Optional[int] = Field(None, ge=0, le=65535)
+    remote_port: Optional[PortNumber] = None
     protocol: str
     state: Optional[str] = None
     pid: Optional[int] = None
     process_name: Optional[str] = Field(None, max_length=255)
 
-    @field_validator("local_ip")
-    @classmethod
-    def validate_local_ip(cls, value: str) -> str:
-        return _validate_ip(value, "local IP address", allow_unspecified=True)
-
-    @field_validator("remote_ip")
-    @classmethod
-    def validate_remote_ip(cls, value: str) -> str:
-        return _validate_ip(value, "remote IP address", allow_unspecified=True)
-
-    @field_validator("protocol")
-    @classmethod
-    def validate_protocol(cls, value: str) -> str:
-        lower = value.lower()
-        if lower not in VALID_PROTOCOLS:
-            raise ValueError(
-                f"Invalid protocol '{value}'. "
-                f"Allowed values: {', '.join(sorted(VALID_PROTOCOLS))}"
-            )
-        return lower
-
-    @field_validator("state")
-    @classmethod
-    def validate_state(cls, value: Optional[str]) -> Optional[str]:
-        if value is None:
-            return value
-        lower = value.lower()
-        if lower not in VALID_CONNECTION_STATES:
-            raise ValueError(
-                f"Invalid connection state '{value}'. "
-                f"Allowed values: {', '.join(sorted(VALID_CONNECTION_STATES))}"
-            )
-        return lower
-
 
 class AgentAddressObservation(BaseModel):
     """Local interface address observation."""
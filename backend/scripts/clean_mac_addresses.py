@@ -22,6 +22,11 @@ services_path = Path(__file__).parent.parent / "services"
 sys.path.insert(0, str(services_path))
 from mac_vendor import MacVendorLookup  # noqa: E402
 
+# Compiled once; clean_mac_address() runs for every host and ARP row.
+_BRACKET_SUFFIX_RE = re.compile(r'\s*\[.*?\]\s*$')
+_MAC_SEPARATOR_RE = re.compile(r'[:\-\.\s]')
+_MAC_HEX12_RE = re.compile(r'^[0-9A-F]{12}$')
+
 
 class MACAddressCleaningMigration:
     """Migration for cleaning MAC addresses in the network database."""
@@ -76,13 +81,13 @@ class MACAddressCleaningMigration:
             return None
 
         # Remove [ether] and other [...] suffixes
-        mac_clean = re.sub(r'\s*\[.*?\]\s*$', '', mac.strip())
+        mac_clean = _BRACKET_SUFFIX_RE.sub('', mac.strip())
 
         # Remove common separators and validate
-        mac_hex = re.sub(r'[:\-\.\s]', '', mac_clean.upper())
+        mac_hex = _MAC_SEPARATOR_RE.sub('', mac_clean.upper())
 
         # Validate: must be 12 hex characters
-        if len(mac_hex) != 12 or not re.match(r'^[0-9A-F]{12}$', mac_hex):
+        if len(mac_hex) != 12 or not _MAC_HEX12_RE.match(mac_hex):
             return None
 
         # Convert to lowercase colon-separated format
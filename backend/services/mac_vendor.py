@@ -25,10 +25,14 @@ logger = logging.getLogger(__name__)
 
 _LOCAL_ADMIN_SECOND_CHARS = set("2367abefABEF")
 
+# Compiled once at import; normalize_mac() runs per host during imports.
+_MAC_SEPARATOR_RE = re.compile(r"[:\-.]")
+_MAC_HEX12_RE = re.compile(r"^[0-9A-F]{12}$")
+
 
 def is_locally_administered(mac: str) -> bool:
     """Return True if the MAC is locally administered (random / not IEEE-assigned)."""
-    clean = re.sub(r"[:\-.]", "", mac)
+    clean = _MAC_SEPARATOR_RE.sub("", mac)
     if len(clean) < 2:
         return False
     return clean[1] in _LOCAL_ADMIN_SECOND_CHARS
@@ -128,8 +132,8 @@ class MacVendorLookup:
         """Normalize MAC address to XX:XX:XX:XX:XX:XX."""
         if not mac:
             return None
-        mac_clean = re.sub(r"[:\-.]", "", mac.upper())
-        if len(mac_clean) != 12 or not re.match(r"^[0-9A-F]{12}$", mac_clean):
+        mac_clean = _MAC_SEPARATOR_RE.sub("", mac.upper())
+        if len(mac_clean) != 12 or not _MAC_HEX12_RE.match(mac_clean):
             return None
         return ":".join(mac_clean[i : i + 2] for i in range(0, 12, 2))
 
@@ -6,12 +6,24 @@ Tests cover:
 - Host CRUD operations
 - Validation error formatting
 - Raw imports
+- Connection and ARP list endpoints
 - Network map endpoint
 - Request ID tracking
 """
 
 import pytest
+from database import get_db
 from httpx import AsyncClient
+from main import app
+from models import ARPEntry, Connection, RawImport
+
+
+async def _seed(*rows):
+    """Insert ORM rows into the test database behind async_client."""
+    db_gen = app.dependency_overrides[get_db]()
+    db = await db_gen.__anext__()
+    db.add_all(rows)
+    await db.commit()
 
 
 class TestHealthAndInfo:
@@ -269,6 +281,96 @@ class TestImportsEndpoint:
         # Should be 422 for missing required form field
         assert response.status_code == 422
 
+    @pytest.mark.asyncio
+    async def test_list_imports_body(self, async_client: AsyncClient):
+        """GET /api/imports returns the page envelope and serialized imports."""
+        await _seed(RawImport(
+            source_type="nmap", import_type="file", filename="scan.xml",
+            source_host="scanner01", parse_status="success", parsed_count=3,
+        ))
+
+        response = await async_client.get("/api/imports?limit=10")
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["total"], data["skip"], data["limit"]) == (1, 0, 10)
+        item = data["items"][0]
+        assert item["source_type"] == "nmap"
+        assert item["filename"] == "scan.xml"
+        assert item["source_host"] == "scanner01"
+        assert (item["parse_status"], item["parsed_count"]) == ("success", 3)
+        assert isinstance(item["id"], int)
+        assert "created_at" in item
+
+
+class TestConnectionsEndpoint:
+    """Connection list endpoint tests."""
+
+    @pytest.mark.asyncio
+    async def test_list_connections_body(self, async_client: AsyncClient):
+        """GET /api/connections returns the page envelope and serialized rows."""
+        await _seed(
+            Connection(
+                local_ip="10.0.0.5", local_port=51000, remote_ip="10.0.0.9",
+                remote_port=443, protocol="tcp", state="ESTABLISHED",
+                tags=["app:web"],
+            ),
+            Connection(
+                local_ip="10.0.0.5", local_port=53, remote_ip="10.0.0.1",
+                protocol="udp",
+            ),
+        )
+
+        response = await async_client.get("/api/connections?protocol=tcp")
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["total"], data["skip"], data["limit"]) == (1, 0, 50)
+        item = data["items"][0]
+        assert (item["local_ip"], item["local_port"]) == ("10.0.0.5", 51000)
+        assert (item["remote_ip"], item["remote_port"]) == ("10.0.0.9", 443)
+        assert (item["protocol"], item["state"]) == ("tcp", "ESTABLISHED")
+        assert item["tags"] == ["app:web"]
+
+    @pytest.mark.asyncio
+    async def test_list_connections_empty(self, async_client: AsyncClient):
+        """An empty table still returns the full page envelope."""
+        response = await async_client.get("/api/connections?skip=5&limit=20")
+        assert response.status_code == 200
+        assert response.json() == {"total": 0, "skip": 5, "limit": 20, "items": []}
+
+
+class TestArpEndpoint:
+    """ARP entry list endpoint tests."""
+
+    @pytest.mark.asyncio
+    async def test_list_arp_entries_body(self, async_client: AsyncClient):
+        """GET /api/arp returns the page envelope and serialized entries."""
+        await _seed(ARPEntry(
+            ip_address="10.0.0.1", mac_address="00:1A:2B:3C:4D:5E",
+            interface="eth0", entry_type="dynamic", vendor="Acme",
+        ))
+
+        response = await async_client.get("/api/arp")
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["total"], data["skip"], data["limit"]) == (1, 0, 50)
+        item = data["items"][0]
+        assert (item["ip_address"], item["mac_address"]) == ("10.0.0.1", "00:1A:2B:3C:4D:5E")
+        assert (item["interface"], item["entry_type"]) == ("eth0", "dynamic")
+        assert item["vendor"] == "Acme"
+
+
+class TestPaginatedListSchema:
+    """OpenAPI documentation of the paginated list endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_list_endpoints_document_page_schema(self, async_client: AsyncClient):
+        """The OpenAPI schema still describes the paginated list responses."""
+        response = await async_client.get("/openapi.json")
+        paths = response.json()["paths"]
+        for path in ("/api/hosts", "/api/connections", "/api/arp", "/api/imports"):
+            body = paths[path]["get"]["responses"]["200"]["content"]["application/json"]
+            assert body["schema"]["$ref"].endswith("/PaginatedResponse")
+
 
 class TestNetworkMapEndpoint:
     """Network map visualization endpoint tests."""
@@ -0,0 +1,134 @@
+"""
+Tests for the structured audit logger.
+
+Covers:
+- JSON event structure
+- UTC timestamp format
+- Queued delivery through a background listener
+"""
+
+import json
+import logging
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from utils import logging_utils
+from utils.audit import AuditLogger, _utc_timestamp
+
+
+class TestAuditTimestamp:
+    """UTC timestamp formatting for audit events."""
+
+    def test_timestamp_is_iso8601_utc_with_microseconds(self):
+        before = datetime.now(UTC)
+        stamp = _utc_timestamp()
+
+        assert stamp.endswith("Z")
+        parsed = datetime.strptime(stamp, "%Y-%m-%dT%H:%M:%S.%fZ")
+        parsed = parsed.replace(tzinfo=UTC)
+        assert before - timedelta(seconds=1) <= parsed <= before + timedelta(seconds=5)
+
+    def test_timestamps_within_a_second_share_the_date_part(self):
+        first, second = _utc_timestamp(), _utc_timestamp()
+
+        assert len(first) == len(second) == len("2024-01-01T00:00:00.000000Z")
+        assert first <= second
+
+
+class TestAuditLog:
+    """Structure of the emitted audit event."""
+
+    def test_log_emits_json_event(self, caplog):
+        logger = AuditLogger()
+
+        with caplog.at_level(logging.INFO, logger="audit"):
+            logger.log("CREATE", "alice", "Host", "42", "success", {"ip": "10.0.0.1"})
+
+        event = json.loads(caplog.records[-1].getMessage())
+        assert event["action"] == "CREATE"
+        assert event["actor"] == "alice"
+        assert event["resource_id"] == "42"
+        assert event["details"] == {"ip": "10.0.0.1"}
+        assert event["timestamp"].endswith("Z")
+
+    def test_log_host_crud_event_shape(self, caplog):
+        logger = AuditLogger()
+
+        with caplog.at_level(logging.INFO, logger="audit"):
+            logger.log_host_crud("UPDATE", "7", "10.0.0.7", "db01", {"os_name": "linux"})
+            logger.log_host_crud("DELETE", "8", "10.0.0.8", "db02")
+
+        updated, deleted = (json.loads(r.getMessage()) for r in caplog.records[-2:])
+        assert set(updated) == {
+            "timestamp", "action", "actor", "resource", "resource_id",
+            "status", "request_id", "details",
+        }
+        assert (updated["resource"], updated["status"]) == ("Host", "success")
+        assert updated["details"] == {
+            "ip_address": "10.0.0.7", "hostname": "db01", "changes": {"os_name": "linux"},
+        }
+        assert deleted["details"] == {"ip_address": "10.0.0.8", "hostname": "db02"}
+
+    def test_log_vlan_change_omits_empty_name(self, caplog):
+        logger = AuditLogger()
+
+        with caplog.at_level(logging.INFO, logger="audit"):
+            logger.log_vlan_change("CREATE", "10", "users")
+            logger.log_vlan_change("DELETE", "11")
+
+        created, deleted = (json.loads(r.getMessage()) for r in caplog.records[-2:])
+        assert (created["resource"], created["details"]) == ("VLAN", {"vlan_name": "users"})
+        assert deleted["details"] == {}
+
+    def test_disabled_audit_logger_builds_no_events(self, caplog, monkeypatch):
+        logger = AuditLogger()
+        monkeypatch.setattr("utils.audit._utc_timestamp", lambda: pytest.fail("event built"))
+
+        with caplog.at_level(logging.WARNING, logger="audit"):
+            logger.log_host_crud("UPDATE", "7", "10.0.0.7", "db01")
+            logger.log("CREATE", "alice", "Host", "8", "success")
+
+        assert not [r for r in caplog.records if r.name == "audit"]
+
+
+@pytest.fixture
+def isolated_logging():
+    """Run setup_logging() without leaking handlers or listener threads.
+
+    Saves the root and audit logger configuration and the module's running
+    listener, hides that listener from setup_logging() so it is not
+    stopped, and on teardown stops whatever listener the test started and
+    restores everything.
+    """
+    root = logging.getLogger()
+    audit_logger = logging.getLogger("audit")
+    saved = (
+        root.handlers[:], root.level,
+        audit_logger.handlers[:], audit_logger.level, audit_logger.propagate,
+        logging_utils._audit_listener,
+    )
+    logging_utils._audit_listener = None
+    yield
+    if logging_utils._audit_listener is not None:
+        logging_utils._audit_listener.stop()
+    root.handlers[:], root.level = saved[0], saved[1]
+    audit_logger.handlers[:] = saved[2]
+    audit_logger.level, audit_logger.propagate = saved[3], saved[4]
+    logging_utils._audit_listener = saved[5]
+
+
+class TestAuditHandler:
+    """Wiring of the audit logger by setup_logging()."""
+
+    def test_queued_audit_event_is_written_once_after_flush(self, isolated_logging, capsys):
+        logging_utils.setup_logging()
+        logging_utils.setup_logging()
+
+        AuditLogger().log("CREATE", "alice", "Host", "42", "success")
+        logging_utils._audit_listener.stop()
+        logging_utils._audit_listener = None
+
+        lines = [line for line in capsys.readouterr().out.splitlines() if line]
+        assert len(lines) == 1
+        event = json.loads(lines[0])
+        assert (event["action"], event["resource_id"]) == ("CREATE", "42")
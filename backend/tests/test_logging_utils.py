@@ -0,0 +1,86 @@
+"""
+Tests for the enhanced logging utilities.
+
+Covers:
+- ColoredFormatter timestamp and extras rendering
+- LogTimer start/completion records
+"""
+
+import logging
+import re
+
+import pytest
+from utils.logging_utils import ColoredFormatter, LogTimer
+
+
+def _record(msg="hello", **extra):
+    logger = logging.getLogger("test.logging_utils")
+    return logger.makeRecord(
+        logger.name, logging.INFO, __file__, 1, msg, (), None, "handler", extra=extra
+    )
+
+
+class TestColoredFormatter:
+    """Rendering of console log lines."""
+
+    def test_plain_record_has_no_extras(self):
+        line = ColoredFormatter().format(_record())
+
+        assert re.match(r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d\.\d{3} \| ", line)
+        assert line.endswith("| hello")
+
+    def test_extras_render_in_fixed_order(self):
+        record = _record(
+            "done", progress=40, step=2, total_steps=5, record_count=10, duration_ms=12.34
+        )
+
+        line = ColoredFormatter().format(record)
+
+        assert line.endswith("done [duration=12.3ms, records=10, step=2/5, progress=40%]")
+
+    def test_step_without_total_is_not_rendered(self):
+        line = ColoredFormatter().format(_record("working", step=3))
+
+        assert line.endswith("| working")
+
+
+class TestLogTimer:
+    """Records emitted around a timed block."""
+
+    def test_logs_start_and_completion_with_extras(self, caplog):
+        logger = logging.getLogger("test.logtimer")
+
+        with (
+            caplog.at_level(logging.INFO, logger=logger.name),
+            LogTimer(logger, "parse", step=1, total_steps=3) as timer,
+        ):
+            timer.set_record_count(4)
+
+        start, done = caplog.records
+        assert start.getMessage() == "Starting: parse"
+        assert (start.step, start.total_steps) == (1, 3)
+        assert done.getMessage() == "Completed: parse"
+        assert done.record_count == 4
+        assert done.duration_ms >= 0
+
+    def test_start_without_step_has_no_extras(self, caplog):
+        logger = logging.getLogger("test.logtimer")
+
+        with (
+            caplog.at_level(logging.INFO, logger=logger.name),
+            LogTimer(logger, "parse"),
+        ):
+            pass
+
+        assert not hasattr(caplog.records[0], "step")
+
+    def test_filtered_level_emits_nothing_but_errors_still_log(self, caplog):
+        logger = logging.getLogger("test.logtimer")
+
+        with caplog.at_level(logging.WARNING, logger=logger.name):
+            with LogTimer(logger, "quiet"):
+                pass
+            with pytest.raises(ValueError), LogTimer(logger, "broken"):
+                raise ValueError("bad row")
+
+        assert [r.getMessage() for r in caplog.records] == ["Failed: broken - bad row"]
@@ -1,6 +1,12 @@
 """Tests for tagging utilities."""
 
+from ipaddress import ip_network
+
+import pytest
+
+from utils import tagging
 from utils.tagging import (
+    _derive_subnet_tag,
     build_host_tags,
     build_port_tags,
     build_connection_tags,
@@ -90,3 +96,72 @@ def test_build_arp_tags():
 def test_merge_tags_unique_and_sorted():
     merged = merge_tags(["ip:10.0.0.1", "service:ssh"], ["service:ssh", "port:22"])
     assert merged == ["ip:10.0.0.1", "port:22", "service:ssh"]
+
+
+def test_merge_tags_accepts_unsorted_input_and_drops_blanks():
+    merged = merge_tags(["zone:dmz", "", "owner:ops", None], ["", "owner:ops", "app:web"])
+    assert merged == ["app:web", "owner:ops", "zone:dmz"]
+
+
+def test_tag_values_collapse_any_whitespace():
+    tags = build_host_tags(vendor="  Cisco\tSystems\n Inc ", os_name="Ubuntu 22.04")
+
+    assert "vendor:cisco_systems_inc" in tags
+    assert "os:ubuntu_22.04" in tags
+
+
+def test_tag_values_keep_existing_underscores():
+    tags = build_port_tags(service_name="ms_sql__s", service_product="Acme  DB")
+
+    assert "service:ms_sql__s" in tags
+    assert "product:acme_db" in tags
+
+
+def test_subnet_tag_requires_a_valid_ipv4_address():
+    assert "subnet:10.0.0.0/24" in build_arp_tags(ip_address="10.0.0.255")
+    for bad in ("10.0.0.256", "10.0.01.1", "10.0.0", "10.0.0.1 "):
+        tags = build_arp_tags(ip_address=bad)
+        assert not any(tag.startswith("subnet:") for tag in tags)
+
+
+def test_ipv6_subnet_tags_use_64_bit_prefix():
+    tags = build_connection_tags(local_ip="2001:db8:1:2:3::9", remote_ip="fe80::1%eth0")
+
+    assert "local_subnet:2001:db8:1:2::/64" in tags
+    assert "remote_subnet:fe80::/64" in tags
+
+
+def test_non_string_tag_values_are_stringified():
+    tags = build_arp_tags(ip_address="10.0.0.1", interface=3, entry_type=0)
+
+    assert "interface:3" in tags
+    assert not any(tag.startswith("entry_type:") for tag in tags)
+
+
+@pytest.mark.parametrize("value", ["10.1.2.3", "192.168.255.254", "0.0.0.1", "255.255.255.255"])
+@pytest.mark.parametrize("prefix", [0, 16, 32])
+def test_ipv4_subnet_for_other_prefixes_matches_ip_network(value, prefix):
+    expected = ip_network(f"{value}/{prefix}", strict=False)
+
+    assert _derive_subnet_tag(value, v4_prefix=prefix) == str(expected)
+
+
+@pytest.mark.parametrize("prefix", [-1, 33])
+def test_ipv4_subnet_rejects_invalid_prefix(prefix):
+    with pytest.raises(ValueError):
+        _derive_subnet_tag("10.1.2.3", v4_prefix=prefix)
+
+
+def test_ipv6_with_long_zone_gets_subnet_tag_uncached():
+    before = tagging._subnet_for.cache_info().currsize
+
+    assert _derive_subnet_tag("fe80::1%" + "z" * 64) == "fe80::/64"
+    assert tagging._subnet_for.cache_info().currsize == before
+
+
+def test_overlong_subnet_inputs_are_not_cached():
+    before = tagging._subnet_for.cache_info().currsize
+
+    assert _derive_subnet_tag("1" * 16) is None
+    assert _derive_subnet_tag("a:" * 100_000) is None
+    assert tagging._subnet_for.cache_info().currsize == before
@@ -97,8 +97,35 @@ Trace complete.
         assert hop2.hostname == "example.com"
         assert hop2.ip_address is None
 
+    def test_parse_mtr_ipv6_and_colon_hostname(self):
+        parser = TracerouteParser()
+        data = """HOST: local                                      Loss%   Snt   Last   Avg  Best  Wrst StDev
+  1.|-- 2001:db8::1                               0.0%    10    1.2   1.3   1.1   1.5   0.1
+  2.|-- gw:edge                                   0.0%    10   10.5  10.7  10.4  11.0   0.2
+"""
+        result = parser.parse(data, format_hint="mtr")
+        assert result.route_hops[0].ip_address == "2001:db8::1"
+        assert result.route_hops[1].hostname == "gw:edge"
+        assert result.route_hops[1].ip_address is None
+
     def test_parse_empty_input(self):
         parser = TracerouteParser()
         result = parser.parse("")
         assert result.success is False
         assert result.errors
+
+    def test_long_digit_runs_parse_in_linear_time(self):
+        """Hop lines with long digit runs and no 'ms' must not backtrack."""
+        parser = TracerouteParser()
+        run = "1" * 5000
+        linux = parser.parse(
+            f"traceroute to x (10.0.0.9)\n 1  gw (10.0.0.1)  {run}\n 2  h (10.0.0.9)  {run} 1.5 ms\n"
+        )
+        windows = parser.parse(
+            f"Tracing route to x [10.0.0.9]\n  1  {run}\n  2     1 ms     2 ms     3 ms  {'y' * 5000} [\n"
+        )
+        mtr = parser.parse(f"Loss%\n  1.|-- gw  {'1.' * 5000}\n", format_hint="mtr")
+
+        assert [hop.rtt_ms for hop in linux.route_hops] == [[], [1.5]]
+        assert windows.route_hops[-1].rtt_ms == [1.0, 2.0, 3.0]
+        assert mtr.route_hops[0].hostname == "gw"
@@ -14,8 +14,8 @@ Key features:
 
 import json
 import logging
+import time
 from contextvars import ContextVar
-from datetime import datetime
 from typing import Any, Dict, Optional
 
 
@@ -29,6 +29,30 @@ _actor_context: ContextVar[Optional[str]] = ContextVar(
     'actor', default=None
 )
 
+# Audit events are flat dicts of strings, numbers and small detail dicts that
+# can never reference themselves, so skip the encoder's cycle bookkeeping.
+_event_encoder = json.JSONEncoder(check_circular=False)
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") for the last timestamp built.
+# Rebound as one tuple so concurrent readers never see a mismatched pair.
+_timestamp_second = (-1, '')
+
+
+def _utc_timestamp() -> str:
+    """
+    Return the current UTC time as ISO8601 with microseconds and a 'Z' suffix.
+
+    Events logged within the same second reuse the formatted date/time part,
+    so only the microsecond field is formatted per call.
+    """
+    global _timestamp_second
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _timestamp_second
+    if second != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+        _timestamp_second = (second, prefix)
+    return f'{prefix}.{nanos // 1000:06d}Z'
+
 
 class AuditLogger:
     """
@@ -89,8 +113,11 @@ class AuditLogger:
             status: Result status (e.g., 'success', 'failure', 'partial')
             details: Optional dict of additional context, automatically sanitized
         """
+        # Skip building and encoding events the audit logger would drop.
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         event = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': _utc_timestamp(),
             'action': action,
             'actor': actor if actor != 'user' else (self.get_actor() or 'user'),
             'resource': resource,
@@ -99,7 +126,7 @@ class AuditLogger:
             'request_id': self.get_request_id(),
             'details': details or {},
         }
-        self.logger.info(json.dumps(event))
+        self.logger.info(_event_encoder.encode(event))
     
     def log_import(
         self,
@@ -119,6 +146,8 @@ class AuditLogger:
             record_count: Number of records processed
             error_message: Optional error message if import failed
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         details = {
             'source_type': source_type,
             'filename': filename,
@@ -183,6 +212,8 @@ class AuditLogger:
             hostname: Host name/hostname
             changes: Optional dict of changed fields (for UPDATE operations)
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         details = {
             'ip_address': ip_address,
             'hostname': hostname,
@@ -215,6 +246,8 @@ class AuditLogger:
             status: Operation status (e.g., 'success', 'failure')
             error_message: Optional error message if operation failed
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         details = {'filename': filename}
         if error_message:
             details['error_message'] = error_message
@@ -242,6 +275,8 @@ class AuditLogger:
             vlan_id: VLAN identifier (ID or number)
             vlan_name: Optional VLAN name
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         details = {}
         if vlan_name:
             details['vlan_name'] = vlan_name
@@ -271,6 +306,8 @@ class AuditLogger:
             device_name: Optional device name
             host_ids: Optional list of associated host IDs
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         details = {}
         if device_name:
             details['device_name'] = device_name
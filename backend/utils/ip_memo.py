@@ -0,0 +1,26 @@
+"""Length gate shared by the memoized IP parsers."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+# Longest IPv6 text form ("ffff:...:ffff:255.255.255.255", 45 characters)
+# plus "%" and a 15-character zone ID (an interface name within IFNAMSIZ).
+# Zone IDs have no hard limit, so longer values are still parsed, just not
+# memoized.
+MAX_CACHED_IP_LENGTH = 45 + 1 + 15
+
+
+def call_ip_parser(parser: Callable[..., Any], value: str, *args: Any) -> Optional[Any]:
+    """Call an lru_cache'd IP parser without letting long input into its cache.
+
+    Colon-free values longer than a dotted quad ("255.255.255.255") are not
+    addresses and return None unparsed.  Values past MAX_CACHED_IP_LENGTH go
+    to the parser's uncached ``__wrapped__`` function, so client-supplied
+    junk can never fill the cache with large strings.
+    """
+    if len(value) > 15 and ":" not in value:
+        return None
+    if len(value) > MAX_CACHED_IP_LENGTH:
+        return parser.__wrapped__(value, *args)
+    return parser(value, *args)
@@ -4,13 +4,18 @@ Enhanced logging utilities for verbose, structured logging.
 Provides timing, record counts, and step-by-step progress tracking.
 """
 
+import atexit
 import logging
+import queue
 import time
 import sys
-from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional, Any
 from contextlib import contextmanager
 
+# Background listener that writes audit events; replaced on each setup_logging().
+_audit_listener: Optional[QueueListener] = None
+
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for different log levels."""
@@ -29,8 +34,8 @@ class ColoredFormatter(logging.Formatter):
         # Add color based on level
         color = self.COLORS.get(record.levelname, '')
 
-        # Format timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+        # Format timestamp (record.msecs is already computed by logging)
+        timestamp = f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(record.created))}.{int(record.msecs):03d}"
 
         # Build the message
         level_str = f"{color}{record.levelname:8}{self.RESET}"
@@ -41,19 +46,22 @@ class ColoredFormatter(logging.Formatter):
         # Format the base message
         message = record.getMessage()
 
-        # Add extra context if available
+        # Add extra context if available; most records carry none of these,
+        # so each is a single attribute lookup with a default.
         extras = []
-        for key in ['duration_ms', 'record_count', 'step', 'total_steps', 'progress']:
-            if hasattr(record, key):
-                value = getattr(record, key)
-                if key == 'duration_ms':
-                    extras.append(f"duration={value:.1f}ms")
-                elif key == 'progress':
-                    extras.append(f"progress={value}%")
-                elif key == 'step' and hasattr(record, 'total_steps'):
-                    extras.append(f"step={value}/{record.total_steps}")
-                elif key == 'record_count':
-                    extras.append(f"records={value}")
+        duration_ms = getattr(record, 'duration_ms', None)
+        if duration_ms is not None:
+            extras.append(f"duration={duration_ms:.1f}ms")
+        record_count = getattr(record, 'record_count', None)
+        if record_count is not None:
+            extras.append(f"records={record_count}")
+        step = getattr(record, 'step', None)
+        total_steps = getattr(record, 'total_steps', None)
+        if step is not None and total_steps is not None:
+            extras.append(f"step={step}/{total_steps}")
+        progress = getattr(record, 'progress', None)
+        if progress is not None:
+            extras.append(f"progress={progress}%")
 
         extra_str = f" [{', '.join(extras)}]" if extras else ""
 
@@ -86,12 +94,22 @@ def setup_logging(level: str = "INFO") -> None:
     root.addHandler(handler)
 
     # ── Audit logger: plain JSON to stdout, no duplication ────────
+    # Callers only enqueue the record; a listener thread does the write,
+    # so bulk imports and CRUD loops never block on stdout.
+    global _audit_listener
+    if _audit_listener is not None:
+        _audit_listener.stop()
     audit_logger = logging.getLogger("audit")
     audit_logger.handlers.clear()
     audit_handler = logging.StreamHandler(sys.stdout)
     audit_handler.setFormatter(logging.Formatter("%(message)s"))
     audit_handler.setLevel(logging.INFO)
-    audit_logger.addHandler(audit_handler)
+    audit_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _audit_listener = QueueListener(
+        audit_queue, audit_handler, respect_handler_level=True
+    )
+    _audit_listener.start()
+    audit_logger.addHandler(QueueHandler(audit_queue))
     audit_logger.propagate = False
 
     # Set specific loggers
@@ -100,6 +118,17 @@ def setup_logging(level: str = "INFO") -> None:
     logging.getLogger('sqlalchemy.engine').setLevel(logging.WARNING)
 
 
+def _stop_audit_listener() -> None:
+    """Flush queued audit events and stop the listener thread at exit."""
+    global _audit_listener
+    if _audit_listener is not None:
+        _audit_listener.stop()
+        _audit_listener = None
+
+
+atexit.register(_stop_audit_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with enhanced capabilities.
@@ -147,11 +176,18 @@ class LogTimer:
     def __enter__(self):
         self.start_time = time.perf_counter()
 
-        extra = {}
-        if self.step is not None:
-            extra['step'] = self.step
-        if self.total_steps is not None:
-            extra['total_steps'] = self.total_steps
+        # Timers wrap short per-record operations, so skip building the
+        # record (and any extra dict) when the level is filtered out.
+        if not self.logger.isEnabledFor(self.level):
+            return self
+
+        extra = None
+        if self.step is not None or self.total_steps is not None:
+            extra = {}
+            if self.step is not None:
+                extra['step'] = self.step
+            if self.total_steps is not None:
+                extra['total_steps'] = self.total_steps
 
         self.logger.log(
             self.level,
@@ -163,6 +199,10 @@ class LogTimer:
     def __exit__(self, exc_type, exc_val, exc_tb):
         duration_ms = (time.perf_counter() - self.start_time) * 1000
 
+        level = logging.ERROR if exc_type is not None else self.level
+        if not self.logger.isEnabledFor(level):
+            return False
+
         extra = {'duration_ms': duration_ms}
         if self.record_count is not None:
             extra['record_count'] = self.record_count
@@ -2,40 +2,79 @@
 
 from __future__ import annotations
 
-import re
+from functools import lru_cache
 from ipaddress import ip_address, ip_network
-from typing import Iterable, Optional, List, Set
+from socket import AF_INET, inet_ntoa, inet_pton
+from typing import Iterable, Optional, List
 
-
-def _normalize(value: str) -> str:
-    value = value.strip().lower()
-    value = re.sub(r"\s+", "_", value)
-    return value
+from .ip_memo import call_ip_parser
 
 
-def _add_tag(tags: Set[str], key: str, value: Optional[str]) -> None:
+def _normalize(value: str) -> str:
+    value = value.lower()
+    # Printable strings contain no whitespace other than the plain space,
+    # so IPs, MACs and ports need no further work.
+    if " " not in value and value.isprintable():
+        return value
+    # split() drops leading/trailing whitespace and splits on the same
+    # characters as \s+, so this strips and collapses runs in one pass.
+    return "_".join(value.split())
+
+
+def _add_tag(tags: List[str], prefix: str, value: Optional[str]) -> None:
+    # Callers pass the "key:" prefix literal, so building a tag is a
+    # single concatenation. Each builder uses every key at most once,
+    # so appending never produces a duplicate tag.
     if not value:
         return
-    tags.add(f"{key}:{_normalize(str(value))}")
+    if type(value) is not str:
+        value = str(value)
+    tags.append(prefix + _normalize(value))
 
 
+# The result is already lower-case and space-free, so builders append it
+# directly instead of passing it through _add_tag/_normalize.
 def _derive_subnet_tag(value: Optional[str], v4_prefix: int = 24, v6_prefix: int = 64) -> Optional[str]:
     if not value:
         return None
+    return call_ip_parser(_subnet_for, value, v4_prefix, v6_prefix)
+
+
+# Scans repeat the same addresses across many rows, so memoize the parse.
+@lru_cache(maxsize=8192)
+def _subnet_for(value: str, v4_prefix: int, v6_prefix: int) -> Optional[str]:
+    if ":" not in value:
+        # inet_pton() accepts exactly the canonical dotted quads ipaddress
+        # does, so IPv4 never needs ipaddress objects.
+        try:
+            packed = inet_pton(AF_INET, value)
+        except (OSError, ValueError):
+            return None
+        if v4_prefix == 24:
+            # The /24 network is the value with its last octet zeroed.
+            return f"{value[:value.rindex('.')]}.0/24"
+        if not 0 <= v4_prefix <= 32:
+            raise ValueError(f"Invalid IPv4 prefix length: {v4_prefix}")
+        mask = (0xFFFFFFFF << (32 - v4_prefix)) & 0xFFFFFFFF
+        network = (int.from_bytes(packed, "big") & mask).to_bytes(4, "big")
+        return f"{inet_ntoa(network)}/{v4_prefix}"
     try:
-        addr = ip_address(value)
+        ip_address(value)
     except ValueError:
         return None
 
-    prefix = v4_prefix if addr.version == 4 else v6_prefix
-    network = ip_network(f"{value}/{prefix}", strict=False)
-    return f"{network.network_address}/{prefix}"
+    network = ip_network(f"{value}/{v6_prefix}", strict=False)
+    return f"{network.network_address}/{v6_prefix}"
 
 
 def merge_tags(existing: Optional[List[str]], new_tags: Iterable[str]) -> List[str]:
     """Merge new tags into existing tag list, ensuring uniqueness."""
-    merged = set(t for t in (existing or []) if t)
-    merged.update(t for t in new_tags if t)
+    merged = set(existing or ())
+    merged.update(new_tags)
+    # Drop blank entries after the C-level set building instead of
+    # filtering each tag through a generator.
+    merged.discard("")
+    merged.discard(None)
     return sorted(merged)
 
 
@@ -48,16 +87,19 @@ def build_host_tags(
     os_family: Optional[str] = None,
     os_name: Optional[str] = None,
 ) -> List[str]:
-    tags: Set[str] = set()
-    _add_tag(tags, "ip", ip_address)
-    _add_tag(tags, "subnet", _derive_subnet_tag(ip_address))
-    _add_tag(tags, "mac", mac_address)
-    _add_tag(tags, "hostname", hostname)
-    _add_tag(tags, "fqdn", fqdn)
-    _add_tag(tags, "vendor", vendor)
-    _add_tag(tags, "os_family", os_family)
-    _add_tag(tags, "os", os_name)
-    return sorted(tags)
+    tags: List[str] = []
+    _add_tag(tags, "ip:", ip_address)
+    subnet = _derive_subnet_tag(ip_address)
+    if subnet:
+        tags.append("subnet:" + subnet)
+    _add_tag(tags, "mac:", mac_address)
+    _add_tag(tags, "hostname:", hostname)
+    _add_tag(tags, "fqdn:", fqdn)
+    _add_tag(tags, "vendor:", vendor)
+    _add_tag(tags, "os_family:", os_family)
+    _add_tag(tags, "os:", os_name)
+    tags.sort()
+    return tags
 
 
 def build_port_tags(
@@ -68,17 +110,18 @@ def build_port_tags(
     service_product: Optional[str] = None,
     service_version: Optional[str] = None,
 ) -> List[str]:
-    tags: Set[str] = set()
+    tags: List[str] = []
     if port_number is not None:
-        _add_tag(tags, "port", str(port_number))
+        _add_tag(tags, "port:", str(port_number))
     if port_number is not None and protocol:
-        _add_tag(tags, "port_proto", f"{port_number}/{protocol}")
-    _add_tag(tags, "protocol", protocol)
-    _add_tag(tags, "state", state)
-    _add_tag(tags, "service", service_name)
-    _add_tag(tags, "product", service_product)
-    _add_tag(tags, "version", service_version)
-    return sorted(tags)
+        _add_tag(tags, "port_proto:", f"{port_number}/{protocol}")
+    _add_tag(tags, "protocol:", protocol)
+    _add_tag(tags, "state:", state)
+    _add_tag(tags, "service:", service_name)
+    _add_tag(tags, "product:", service_product)
+    _add_tag(tags, "version:", service_version)
+    tags.sort()
+    return tags
 
 
 def build_connection_tags(
@@ -90,19 +133,24 @@ def build_connection_tags(
     state: Optional[str] = None,
     process_name: Optional[str] = None,
 ) -> List[str]:
-    tags: Set[str] = set()
-    _add_tag(tags, "local_ip", local_ip)
+    tags: List[str] = []
+    _add_tag(tags, "local_ip:", local_ip)
     if local_port is not None:
-        _add_tag(tags, "local_port", str(local_port))
-    _add_tag(tags, "local_subnet", _derive_subnet_tag(local_ip))
-    _add_tag(tags, "remote_ip", remote_ip)
+        _add_tag(tags, "local_port:", str(local_port))
+    local_subnet = _derive_subnet_tag(local_ip)
+    if local_subnet:
+        tags.append("local_subnet:" + local_subnet)
+    _add_tag(tags, "remote_ip:", remote_ip)
     if remote_port is not None:
-        _add_tag(tags, "remote_port", str(remote_port))
-    _add_tag(tags, "remote_subnet", _derive_subnet_tag(remote_ip))
-    _add_tag(tags, "protocol", protocol)
-    _add_tag(tags, "state", state)
-    _add_tag(tags, "process", process_name)
-    return sorted(tags)
+        _add_tag(tags, "remote_port:", str(remote_port))
+    remote_subnet = _derive_subnet_tag(remote_ip)
+    if remote_subnet:
+        tags.append("remote_subnet:" + remote_subnet)
+    _add_tag(tags, "protocol:", protocol)
+    _add_tag(tags, "state:", state)
+    _add_tag(tags, "process:", process_name)
+    tags.sort()
+    return tags
 
 
 def build_arp_tags(
@@ -112,11 +160,14 @@ def build_arp_tags(
     entry_type: Optional[str] = None,
     vendor: Optional[str] = None,
 ) -> List[str]:
-    tags: Set[str] = set()
-    _add_tag(tags, "ip", ip_address)
-    _add_tag(tags, "subnet", _derive_subnet_tag(ip_address))
-    _add_tag(tags, "mac", mac_address)
-    _add_tag(tags, "interface", interface)
-    _add_tag(tags, "entry_type", entry_type)
-    _add_tag(tags, "vendor", vendor)
-    return sorted(tags)
+    tags: List[str] = []
+    _add_tag(tags, "ip:", ip_address)
+    subnet = _derive_subnet_tag(ip_address)
+    if subnet:
+        tags.append("subnet:" + subnet)
+    _add_tag(tags, "mac:", mac_address)
+    _add_tag(tags, "interface:", interface)
+    _add_tag(tags, "entry_type:", entry_type)
+    _add_tag(tags, "vendor:", vendor)
+    tags.sort()
+    return tags
@@ -8,12 +8,34 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[1]
 
 
+VERSION_HEADING_RE = re.compile(r"##\s+(\d+\.\d+\.\d+)")
+PACKAGE_VERSION_RE = re.compile(r'\s*"version"\s*:\s*"([^"\\]+)"\s*,?\s*$')
+
+
 def changelog_version(path: Path) -> str:
-    content = path.read_text(encoding="utf-8")
-    match = re.search(r"^##\s+(\d+\.\d+\.\d+)", content, re.MULTILINE)
-    if not match:
-        raise ValueError(f"No version heading found in {path}")
-    return match.group(1)
+    # The newest release heading sits near the top, so stop at the first match.
+    with path.open(encoding="utf-8") as changelog:
+        for line in changelog:
+            if line.startswith("##"):
+                match = VERSION_HEADING_RE.match(line)
+                if match:
+                    return match.group(1)
+    raise ValueError(f"No version heading found in {path}")
+
+
+def package_version(path: Path) -> str:
+    # "version" normally sits in the first few lines of package.json. Only
+    # lines before the first nested object or array are top-level keys, so
+    # anything past that point is left to the full JSON parse.
+    with path.open(encoding="utf-8") as package:
+        next(package, None)
+        for line in package:
+            match = PACKAGE_VERSION_RE.match(line)
+            if match:
+                return match.group(1)
+            if line.rstrip().endswith(("{", "[")):
+                break
+    return json.loads(path.read_text(encoding="utf-8"))["version"]
 
 
 def check_backend() -> list[str]:
@@ -33,7 +55,7 @@ def check_frontend() -> list[str]:
     errors: list[str] = []
     package_json = ROOT / "frontend" / "package.json"
     changelog = ROOT / "frontend" / "CHANGELOG.md"
-    version = json.loads(package_json.read_text(encoding="utf-8"))["version"]
+    version = package_version(package_json)
     changelog_version_value = changelog_version(changelog)
     if version != changelog_version_value:
         errors.append(